@@ -0,0 +1,4 @@
+from src.langgraphagent.benchmark import run_benchmark_app
+
+if __name__ == "__main__":
+    run_benchmark_app()
@@ -0,0 +1,179 @@
+import argparse
+import contextlib
+import io
+import math
+import os
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+from langchain_core.callbacks import BaseCallbackHandler
+from src.langgraphagent.llms.llmscripted import ScriptedLLM, SCRIPTED_PLAN
+from src.langgraphagent.graph.graph_builder import GraphBuilder
+from src.langgraphagent.tools.parser_index import build_index
+
+def _percentile(values: list, pct: float) -> float:
+    """
+    Nearest-rank percentile of a list of numbers.
+    """
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(0, math.ceil(pct * len(ordered) / 100) - 1)
+    return ordered[rank]
+
+class _NodeTimer(BaseCallbackHandler):
+    """
+    Records how long each graph node spends in its own work, so the time LangGraph
+    spends between nodes can be reported separately.
+    """
+    def __init__(self):
+        self.started = {}
+        self.timings = []
+
+    def on_chain_start(self, serialized, inputs, *, run_id, metadata=None, **kwargs):
+        node = (metadata or {}).get("langgraph_node")
+        if node and kwargs.get("name") == node:
+            self.started[run_id] = (node, time.perf_counter())
+
+    def on_chain_end(self, outputs, *, run_id, **kwargs):
+        if run_id in self.started:
+            node, start = self.started.pop(run_id)
+            self.timings.append((node, time.perf_counter() - start))
+
+def _prepare_workspace(source_bank: str, runs: int) -> str:
+    """
+    Creates a scratch copy of the project data so concurrent runs never share a parser file.
+    Each run targets its own bank, `bench_<n>`, backed by the source bank's sample PDF and CSV.
+    """
+    workspace = tempfile.mkdtemp(prefix="agent_bench_")
+    os.makedirs(os.path.join(workspace, "custom_parsers"))
+    shutil.copy(f"custom_parsers/{source_bank}_parser.py", os.path.join(workspace, "custom_parsers"))
+    shutil.copytree(f"data/{source_bank}", os.path.join(workspace, "data", source_bank))
+
+    for n in range(runs):
+        bank_dir = os.path.join(workspace, "data", f"bench_{n}")
+        os.makedirs(bank_dir)
+        shutil.copy(f"data/{source_bank}/{source_bank} sample.pdf", os.path.join(bank_dir, f"bench_{n} sample.pdf"))
+        shutil.copy(f"data/{source_bank}/result.csv", os.path.join(bank_dir, "result.csv"))
+    return workspace
+
+def _run_once(llm_config: ScriptedLLM, target_bank: str, retries: int, use_parser_index: bool) -> dict:
+    """
+    Runs the agent graph once, timing each node's work and the orchestration overhead around it.
+    """
+    graph = GraphBuilder(llm_config.get_llm_model(), use_parser_index=use_parser_index).build_graph()
+    initial_state = {
+        "target_bank": target_bank,
+        "reference_bank": "",
+        "reference_code": "",
+        "plan": "",
+        "generated_code": "",
+        "error_message": "",
+        "retries_left": retries,
+    }
+
+    timer = _NodeTimer()
+    config = {"recursion_limit": 10 + 2 * retries, "callbacks": [timer]}
+    succeeded = False
+    start = time.perf_counter()
+    for update in graph.stream(initial_state, config, stream_mode="updates"):
+        if "tester" in update:
+            succeeded = update["tester"].get("error_message") is None
+    duration = time.perf_counter() - start
+    overhead = duration - sum(seconds for _, seconds in timer.timings)
+    return {"duration": duration, "overhead": overhead, "nodes": timer.timings, "succeeded": succeeded}
+
+def _measure_memory(llm_config: ScriptedLLM, retries: int, use_parser_index: bool) -> int:
+    """
+    Returns the peak memory allocated by a single run, in bytes.
+    """
+    tracemalloc.start()
+    try:
+        _run_once(llm_config, "bench_0", retries, use_parser_index)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+def run_benchmark_app():
+    """
+    Drives many concurrent agent runs against the scripted local chat model and
+    reports throughput, per-node latency percentiles and memory per run.
+    """
+    parser = argparse.ArgumentParser(description="Benchmark the agent loop offline with a scripted chat model.")
+    parser.add_argument("--runs", type=int, default=50, help="Total number of agent runs.")
+    parser.add_argument("--concurrency", type=int, default=8, help="Number of runs executed at the same time.")
+    parser.add_argument("--retries", type=int, default=3, help="The maximum number of self-correction attempts per run.")
+    parser.add_argument("--source", type=str, default="icici", help="Bank whose sample data and parser back every run.")
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds before the model's first token.")
+    parser.add_argument("--token-latency", type=float, default=0.0, help="Seconds to generate each token, with or without streaming.")
+    parser.add_argument("--streaming", action="store_true", help="Stream tokens from the model instead of returning at once.")
+    parser.add_argument("--coder", type=str, default="fail", help="Comma-separated pass/fail script for the coder.")
+    parser.add_argument("--corrector", type=str, default="pass", help="Comma-separated pass/fail script for the corrector.")
+    parser.add_argument("--with-index", action="store_true",
+                        help="Include parser retrieval and registration, which fingerprint PDFs and write the index.")
+    parser.add_argument("--verbose", action="store_true", help="Show the agent's own output for every run.")
+    args = parser.parse_args()
+
+    with open(f"custom_parsers/{args.source}_parser.py") as f:
+        success_code = f.read()
+
+    llm_config = ScriptedLLM(
+        scripts={
+            "planner": [SCRIPTED_PLAN],
+            "coder": args.coder.split(","),
+            "corrector": args.corrector.split(","),
+        },
+        success_code=success_code,
+        latency=args.latency,
+        token_latency=args.token_latency,
+        streaming=args.streaming,
+    )
+
+    project_root = os.getcwd()
+    workspace = _prepare_workspace(args.source, args.runs)
+    os.chdir(workspace)
+    sys.path.insert(0, workspace)
+    mode = "with" if args.with_index else "without"
+    print(f"Benchmarking {args.runs} runs with concurrency {args.concurrency} {mode} the parser index in {workspace}...")
+
+    try:
+        output = contextlib.nullcontext() if args.verbose else contextlib.redirect_stdout(io.StringIO())
+        with output:
+            if args.with_index:
+                # Build the parser index up front so runs don't race to create it.
+                build_index()
+            start = time.perf_counter()
+            with ThreadPoolExecutor(max_workers=args.concurrency) as executor:
+                results = list(executor.map(
+                    lambda n: _run_once(llm_config, f"bench_{n}", args.retries, args.with_index), range(args.runs)
+                ))
+            elapsed = time.perf_counter() - start
+            peak_memory = _measure_memory(llm_config, args.retries, args.with_index)
+    finally:
+        os.chdir(project_root)
+        sys.path.remove(workspace)
+        shutil.rmtree(workspace, ignore_errors=True)
+
+    node_latencies = {}
+    for result in results:
+        for node, seconds in result["nodes"]:
+            node_latencies.setdefault(node, []).append(seconds * 1000)
+    node_latencies["overhead"] = [result["overhead"] * 1000 for result in results]
+    run_latencies = [result["duration"] * 1000 for result in results]
+
+    print("\n--- BENCHMARK COMPLETE ---")
+    print(f"Runs: {len(results)} ({sum(r['succeeded'] for r in results)} succeeded)")
+    print(f"Wall-clock: {elapsed:.2f}s")
+    print(f"Throughput: {len(results) / elapsed:.2f} runs/sec")
+    print(f"Memory per run (peak): {peak_memory / 1024:.1f} KiB")
+    print("Node rows time each node's own work; 'overhead' is the rest of each run, spent in LangGraph.")
+    print(f"\n{'node':<12}{'calls':>8}{'p50 ms':>10}{'p90 ms':>10}{'p99 ms':>10}")
+    for node, values in list(node_latencies.items()) + [("run", run_latencies)]:
+        print(f"{node:<12}{len(values):>8}{_percentile(values, 50):>10.1f}"
+              f"{_percentile(values, 90):>10.1f}{_percentile(values, 99):>10.1f}")
+
+if __name__ == "__main__":
+    run_benchmark_app()
@@ -1,5 +1,6 @@
 from langgraph.graph import StateGraph, END, START
 from src.langgraphagent.state.state import State
+from src.langgraphagent.nodes.retriever_node import RetrieverNode
 from src.langgraphagent.nodes.planner_node import PlannerNode
 from src.langgraphagent.nodes.coder_node import CoderNode
 from src.langgraphagent.nodes.tester_node import TesterNode
@@ -22,9 +23,11 @@ def should_continue(state: State) -> str:
 class GraphBuilder:
     """
     Build the LangGraph agent graph.
+    Set `use_parser_index` to False to skip retrieving and registering proven parsers.
     """
-    def __init__(self, model):
+    def __init__(self, model, use_parser_index: bool = True):
         self.llm = model
+        self.use_parser_index = use_parser_index
         self.graph_builder = StateGraph(State)
 
     def build_graph(self):
@@ -34,7 +37,7 @@ class GraphBuilder:
         # Initializing nodes
         planner_node = PlannerNode(self.llm)
         coder_node = CoderNode(self.llm)
-        tester_node = TesterNode()
+        tester_node = TesterNode(register_parsers=self.use_parser_index)
         corrector_node = CorrectorNode(self.llm)
 
         # Adding nodes
@@ -44,7 +47,13 @@ class GraphBuilder:
         self.graph_builder.add_node("corrector", corrector_node.process)
 
         # Node Edges
-        self.graph_builder.add_edge(START, "planner")
+        if self.use_parser_index:
+            retriever_node = RetrieverNode()
+            self.graph_builder.add_node("retriever", retriever_node.process)
+            self.graph_builder.add_edge(START, "retriever")
+            self.graph_builder.add_edge("retriever", "planner")
+        else:
+            self.graph_builder.add_edge(START, "planner")
         self.graph_builder.add_edge("planner", "coder")
         self.graph_builder.add_edge("coder", "tester")
         self.graph_builder.add_conditional_edges(
@@ -0,0 +1,128 @@
+import re
+import time
+import threading
+from typing import Any, Dict, List, Optional
+
+from langchain_core.callbacks import CallbackManagerForLLMRun
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessage, AIMessageChunk, BaseMessage
+from langchain_core.outputs import ChatGeneration, ChatGenerationChunk, ChatResult
+from pydantic import Field, PrivateAttr
+
+SCRIPTED_PLAN = """1. Open the PDF with pdfplumber and extract the tables on every page.
+2. Find the header row by looking for keywords such as 'Date', 'Description' and 'Balance'.
+3. Collect the rows below the header, skipping repeated headers and footers.
+4. Build a DataFrame with the detected headers and convert the amount columns to floats."""
+
+SCRIPTED_FAILURE_CODE = """import pandas as pd
+
+def parse(pdf_path: str) -> pd.DataFrame:
+    raise ValueError("Scripted failure from the local chat model.")
+"""
+
+# Passes the repo's tester for any bank by returning the expected CSV stored next to the sample PDF.
+SCRIPTED_SUCCESS_CODE = """import os
+import pandas as pd
+
+def parse(pdf_path: str) -> pd.DataFrame:
+    return pd.read_csv(os.path.join(os.path.dirname(pdf_path), "result.csv"))
+"""
+
+# Nodes tag their LLM calls with their role, which selects the script to replay.
+ROLES = ("planner", "coder", "corrector")
+
+
+class ScriptedChatModel(BaseChatModel):
+    """
+    A deterministic chat model that replays scripted answers for the planner, coder and corrector.
+    The script is chosen by the role tag the node passes in the call config.
+    Each script is a list of outcomes: 'pass' answers with `success_code`, 'fail' with
+    `failure_code`, and anything else is returned verbatim. Once a script runs out,
+    its last outcome is repeated. A 'pass' only passes the Tester if `success_code` is a
+    parser that really passes; the default returns the bank's `result.csv`.
+    `latency` is the delay before the first token and `token_latency` the time to generate
+    each token, in both modes. With `streaming` set, tokens are also sent to the callbacks
+    one by one as they are generated.
+    """
+    scripts: Dict[str, List[str]] = Field(
+        default_factory=lambda: {"planner": [SCRIPTED_PLAN], "coder": ["fail"], "corrector": ["pass"]}
+    )
+    success_code: str = SCRIPTED_SUCCESS_CODE
+    failure_code: str = SCRIPTED_FAILURE_CODE
+    latency: float = 0.0
+    token_latency: float = 0.0
+    streaming: bool = False
+
+    _calls: Dict[str, int] = PrivateAttr(default_factory=dict)
+    _lock: threading.Lock = PrivateAttr(default_factory=threading.Lock)
+
+    @property
+    def _llm_type(self) -> str:
+        return "scripted-chat"
+
+    def _role(self, run_manager: Optional[CallbackManagerForLLMRun]) -> str:
+        tags = run_manager.tags if run_manager else []
+        for role in ROLES:
+            if role in tags:
+                return role
+        raise ValueError(f"Scripted chat model needs one of the tags {ROLES} to pick a script, got {tags}.")
+
+    def _next_response(self, run_manager: Optional[CallbackManagerForLLMRun]) -> str:
+        role = self._role(run_manager)
+        script = self.scripts.get(role) or ["pass"]
+        with self._lock:
+            call = self._calls.get(role, 0)
+            self._calls[role] = call + 1
+        outcome = script[min(call, len(script) - 1)]
+        if outcome == "pass":
+            return self.success_code
+        if outcome == "fail":
+            return self.failure_code
+        return outcome
+
+    def _generate(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Optional[CallbackManagerForLLMRun] = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        # Tokens are emitted from here rather than from `_stream`, because langchain
+        # does not hand the run manager (and so the role tags) to `_stream`.
+        content = self._next_response(run_manager)
+        time.sleep(self.latency)
+        for token in re.findall(r"\s*\S+", content):
+            if self.token_latency:
+                time.sleep(self.token_latency)
+            if self.streaming and run_manager:
+                run_manager.on_llm_new_token(token, chunk=ChatGenerationChunk(message=AIMessageChunk(content=token)))
+        return ChatResult(generations=[ChatGeneration(message=AIMessage(content=content))])
+
+
+class ScriptedLLM:
+    """
+    A class to configure and provide the scripted local LLM model.
+    Drop-in replacement for GroqLLM when running offline or benchmarking the agent loop.
+    """
+    def __init__(self, scripts: Optional[Dict[str, List[str]]] = None, success_code: str = SCRIPTED_SUCCESS_CODE,
+                 latency: float = 0.0, token_latency: float = 0.0, streaming: bool = False):
+        self.scripts = scripts
+        self.success_code = success_code
+        self.latency = latency
+        self.token_latency = token_latency
+        self.streaming = streaming
+
+    def get_llm_model(self):
+        """
+        Returns a new scripted chat model. Each model keeps its own position in the scripts,
+        so use one model per agent run.
+        """
+        kwargs = {
+            "success_code": self.success_code,
+            "latency": self.latency,
+            "token_latency": self.token_latency,
+            "streaming": self.streaming,
+        }
+        if self.scripts is not None:
+            kwargs["scripts"] = self.scripts
+        return ScriptedChatModel(**kwargs)
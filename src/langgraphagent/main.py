@@ -34,6 +34,8 @@ def run_agent_app():
         #Initial states
         initial_state = {
             "target_bank": args.target,
+            "reference_bank": "",
+            "reference_code": "",
             "plan": "",
             "generated_code": "",
             "error_message": "",
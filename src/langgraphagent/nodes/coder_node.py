@@ -15,10 +15,19 @@ class CoderNode:
         Generates Python code based on the provided plan.
         """
         print("--- GENERATING CODE ---")
+        reference = ""
+        if state.get("reference_code"):
+            reference = f"""
+                Start from this proven parser for '{state['reference_bank']}', which handles a similar layout, and reuse its header, footer and row-merging logic where it applies:
+                ```python
+                {state['reference_code']}
+                ```
+                """
         messages = [
             HumanMessage(
                 content=f"""Based on this plan:
                 '{state['plan']}'
+                {reference}
 
                 Please now write the complete Python code for the parser.
                 
@@ -33,7 +42,7 @@ class CoderNode:
                 """
             )
         ]
-        response = self.llm.invoke(messages)
+        response = self.llm.invoke(messages, config={"tags": ["coder"]})
         code = response.content.strip().replace("```python", "").replace("```", "")
         write_code_to_file(state["target_bank"], code)
         return {"generated_code": code}
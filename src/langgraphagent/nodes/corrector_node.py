@@ -35,7 +35,7 @@ class CorrectorNode:
                 """
             )
         ]
-        response = self.llm.invoke(messages)
+        response = self.llm.invoke(messages, config={"tags": ["corrector"]})
         code = response.content.strip().replace("```python", "").replace("```", "")
         write_code_to_file(state["target_bank"], code)
         return {"generated_code": code, "retries_left": retries}
@@ -14,6 +14,14 @@ class PlannerNode:
         Processes the current state to generate a plan.
         """
         print("--- PLANNING ---")
+        reference = ""
+        if state.get("reference_code"):
+            reference = f"""
+                A proven parser for '{state['reference_bank']}' has a very similar statement layout. Use it as your starting point and plan only the changes needed for '{state['target_bank']}':
+                ```python
+                {state['reference_code']}
+                ```
+                """
         messages = [
             HumanMessage(
                 content=f"""Your task is to create a Python script that parses a PDF bank statement for '{state['target_bank']}'.
@@ -24,11 +32,11 @@ class PlannerNode:
                 3.  This function will be saved in `custom_parsers/{state['target_bank']}_parser.py`.
                 4.  The final output DataFrame must exactly match the data in `data/{state['target_bank']}/result.csv`.
                 5.  You must use the `pdfplumber` library for parsing the PDF.
-
+                {reference}
                 Create a concise, step-by-step plan to implement this intelligent parsing logic. Do not write the code itself yet.
                 """
             )
         ]
-        response = self.llm.invoke(messages)
+        response = self.llm.invoke(messages, config={"tags": ["planner"]})
         return {"plan": response.content}
 
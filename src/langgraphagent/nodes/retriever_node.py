@@ -0,0 +1,23 @@
+from src.langgraphagent.state.state import State
+from src.langgraphagent.tools.parser_index import find_closest_parser
+
+class RetrieverNode:
+    """
+    Node 0: The Retriever
+    Looks up the proven parser whose sample layout is closest to the target bank.
+    """
+    def __init__(self):
+        pass
+
+    def process(self, state: State) -> dict:
+        """
+        Finds a reference parser to use as a starting point for planning and coding.
+        """
+        print("--- RETRIEVING REFERENCE PARSER ---")
+        match = find_closest_parser(state["target_bank"])
+        if not match:
+            print("No similar parser found. Starting from scratch.")
+            return {"reference_bank": "", "reference_code": ""}
+
+        print(f"Closest parser: {match['parser_path']} (score {match['score']})")
+        return {"reference_bank": match["bank"], "reference_code": match["code"]}
@@ -1,13 +1,14 @@
 from src.langgraphagent.state.state import State
 from src.langgraphagent.tools.test_tools import run_tests
+from src.langgraphagent.tools.parser_index import register_parser
 
 class TesterNode:
     """
     Node 3: The Tester
     Runs the tests on the generated code.
     """
-    def __init__(self):
-        pass
+    def __init__(self, register_parsers: bool = True):
+        self.register_parsers = register_parsers
 
     def process(self, state: State) -> dict:
         """
@@ -18,6 +19,8 @@ class TesterNode:
         print(f"Test Results: {results}")
 
         if "successfully" in results:
+            if self.register_parsers:
+                register_parser(state["target_bank"])
             return {"error_message": None, "test_results": results}
         else:
             return {"error_message": results, "test_results": results}
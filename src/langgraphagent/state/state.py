@@ -6,6 +6,8 @@ class State(TypedDict):
     """
     target_bank: str
     task: str
+    reference_bank: str
+    reference_code: str
     plan: str
     generated_code: str
     test_results: str
@@ -0,0 +1,263 @@
+import hashlib
+import json
+import os
+import re
+import tempfile
+import threading
+from typing import List, Optional
+
+import pdfplumber
+
+from src.langgraphagent.tools.test_tools import run_tests
+
+INDEX_PATH = "custom_parsers/parser_index.json"
+# A score of 0.3 needs roughly a third of the header tokens in common even when the
+# column geometry lines up exactly; layouts with no shared tokens always score 0.
+MIN_MATCH_SCORE = 0.3
+
+# Guards the index file when several agent runs share one process.
+_INDEX_LOCK = threading.RLock()
+
+_HEADER_KEYWORDS = {
+    "date",
+    "transaction",
+    "txn",
+    "description",
+    "details",
+    "particulars",
+    "narration",
+    "debit",
+    "credit",
+    "withdrawal",
+    "deposit",
+    "amount",
+    "amt",
+    "balance",
+    "bal",
+}
+
+
+def _tokenize(text: str) -> List[str]:
+    return re.findall(r"[a-z]+", (text or "").lower())
+
+
+def _is_header_text(cells: List[Optional[str]]) -> bool:
+    tokens = set(_tokenize(" ".join(c for c in cells if c)))
+    return len(tokens & _HEADER_KEYWORDS) >= 2
+
+
+def _fingerprint_from_tables(page) -> Optional[dict]:
+    """
+    Uses pdfplumber's table detection to read the header row and its cell boundaries.
+    """
+    for table in page.find_tables():
+        for row, cells in zip(table.rows, table.extract()):
+            if not _is_header_text(cells):
+                continue
+            boxes = [box for box in row.cells if box is not None]
+            if not boxes:
+                continue
+            edges = [box[0] / page.width for box in boxes] + [boxes[-1][2] / page.width]
+            return {
+                "header_tokens": sorted(set(_tokenize(" ".join(c for c in cells if c)))),
+                "column_edges": [round(e, 4) for e in edges],
+            }
+    return None
+
+
+def _fingerprint_from_words(page) -> Optional[dict]:
+    """
+    Fallback for statements without ruled tables: finds the header line from the
+    word positions and splits it into columns on large horizontal gaps.
+    """
+    lines = {}
+    for word in page.extract_words():
+        lines.setdefault(round(word["top"]), []).append(word)
+
+    for top in sorted(lines):
+        words = sorted(lines[top], key=lambda w: w["x0"])
+        if not _is_header_text([w["text"] for w in words]):
+            continue
+        columns = [[words[0]]]
+        for word in words[1:]:
+            if word["x0"] - columns[-1][-1]["x1"] > 10:
+                columns.append([word])
+            else:
+                columns[-1].append(word)
+        edges = [col[0]["x0"] / page.width for col in columns] + [columns[-1][-1]["x1"] / page.width]
+        return {
+            "header_tokens": sorted(set(_tokenize(" ".join(w["text"] for w in words)))),
+            "column_edges": [round(e, 4) for e in edges],
+        }
+    return None
+
+
+def fingerprint_pdf(pdf_path: str) -> Optional[dict]:
+    """
+    Builds a layout fingerprint of a sample statement: the tokens of the transaction
+    table header and the column boundaries as fractions of the page width.
+    Returns None if no header could be found.
+    """
+    try:
+        with pdfplumber.open(pdf_path) as pdf:
+            for page in pdf.pages:
+                fingerprint = _fingerprint_from_tables(page) or _fingerprint_from_words(page)
+                if fingerprint:
+                    return fingerprint
+    except Exception as e:
+        print(f"Could not fingerprint {pdf_path}: {e}")
+    return None
+
+
+def similarity(a: dict, b: dict) -> float:
+    """
+    Scores two fingerprints between 0 and 1.
+    Header tokens are compared with Jaccard similarity, column geometry by the
+    average distance between matching column boundaries. Geometry only scales the
+    token score, since most tables span the page and look alike by geometry alone.
+    """
+    tokens_a, tokens_b = set(a["header_tokens"]), set(b["header_tokens"])
+    union = tokens_a | tokens_b
+    token_score = len(tokens_a & tokens_b) / len(union) if union else 0.0
+    if not token_score:
+        return 0.0
+
+    edges_a, edges_b = a["column_edges"], b["column_edges"]
+    if not edges_a or not edges_b:
+        geometry_score = 0.0
+    else:
+        if len(edges_a) > len(edges_b):
+            edges_a, edges_b = edges_b, edges_a
+        distance = sum(min(abs(x - y) for y in edges_b) for x in edges_a) / len(edges_a)
+        geometry_score = max(0.0, 1.0 - distance) * len(edges_a) / len(edges_b)
+
+    return round(token_score * (0.5 + 0.5 * geometry_score), 4)
+
+
+def load_index(index_path: str = INDEX_PATH, exclude: Optional[str] = None) -> dict:
+    """
+    Loads the parser index, building it from the existing parsers on first use.
+    `exclude` names a bank whose parser should not be run if the index has to be built.
+    """
+    with _INDEX_LOCK:
+        if not os.path.exists(index_path):
+            return build_index(index_path, exclude)
+        try:
+            with open(index_path) as f:
+                return json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            print(f"Could not read parser index, rebuilding it: {e}")
+            return build_index(index_path, exclude)
+
+
+def save_index(index: dict, index_path: str = INDEX_PATH) -> None:
+    os.makedirs(os.path.dirname(index_path), exist_ok=True)
+    # A unique temp file per write keeps concurrent agent processes from clobbering each other's output.
+    with tempfile.NamedTemporaryFile("w", dir=os.path.dirname(index_path), suffix=".tmp", delete=False) as f:
+        json.dump(index, f, indent=2, sort_keys=True)
+        f.write("\n")
+    os.replace(f.name, index_path)
+
+
+def build_index(index_path: str = INDEX_PATH, exclude: Optional[str] = None) -> dict:
+    """
+    Scans `custom_parsers/` and indexes every parser that still passes its tests.
+    The `exclude` bank is skipped, so the agent never runs a leftover parser for the bank it is working on.
+    """
+    index = {}
+    if os.path.isdir("custom_parsers"):
+        for file_name in sorted(os.listdir("custom_parsers")):
+            if not file_name.endswith("_parser.py"):
+                continue
+            target_bank = file_name[: -len("_parser.py")]
+            if target_bank == exclude or "successfully" not in run_tests(target_bank):
+                continue
+            entry = _make_entry(target_bank)
+            if entry:
+                index[target_bank] = entry
+    save_index(index, index_path)
+    return index
+
+
+def _hash_file(path: str) -> Optional[str]:
+    try:
+        with open(path, "rb") as f:
+            return hashlib.sha256(f.read()).hexdigest()
+    except OSError:
+        return None
+
+
+def _make_entry(target_bank: str) -> Optional[dict]:
+    """
+    Fingerprints the bank's sample PDF and records the hash of the parser that passed,
+    so a later failed run that overwrites the file is not mistaken for a proven parser.
+    """
+    parser_path = f"custom_parsers/{target_bank}_parser.py"
+    code_hash = _hash_file(parser_path)
+    fingerprint = fingerprint_pdf(f"data/{target_bank}/{target_bank} sample.pdf")
+    if not fingerprint or not code_hash:
+        return None
+    return {"parser_path": parser_path, "sha256": code_hash, **fingerprint}
+
+
+def register_parser(target_bank: str, index_path: str = INDEX_PATH) -> None:
+    """
+    Records a parser that has just passed its tests in the index.
+    """
+    entry = _make_entry(target_bank)
+    if not entry:
+        return
+    with _INDEX_LOCK:
+        index = load_index(index_path)
+        index[target_bank] = entry
+        save_index(index, index_path)
+
+
+def _drop_parser(target_bank: str, index_path: str = INDEX_PATH) -> None:
+    with _INDEX_LOCK:
+        index = load_index(index_path)
+        if index.pop(target_bank, None) is not None:
+            save_index(index, index_path)
+
+
+def _revalidate(target_bank: str, index_path: str = INDEX_PATH) -> bool:
+    """
+    Re-runs the tests for a parser whose file no longer matches its index entry (or whose
+    entry predates hashing). A passing parser is registered again, a failing one is dropped.
+    """
+    print(f"Re-validating custom_parsers/{target_bank}_parser.py: it differs from the indexed version.")
+    if "successfully" in run_tests(target_bank):
+        register_parser(target_bank, index_path)
+        return True
+    _drop_parser(target_bank, index_path)
+    return False
+
+
+def find_closest_parser(target_bank: str, index_path: str = INDEX_PATH) -> Optional[dict]:
+    """
+    Finds the indexed parser of another bank whose sample layout is closest to the target bank's sample PDF.
+    Candidates whose file is missing are skipped; candidates whose file changed are re-validated first.
+    Returns a dict with the bank, score and parser source, or None if nothing is close enough.
+    """
+    fingerprint = fingerprint_pdf(f"data/{target_bank}/{target_bank} sample.pdf")
+    if not fingerprint:
+        return None
+
+    candidates = []
+    for bank, entry in load_index(index_path, exclude=target_bank).items():
+        if bank == target_bank:
+            continue
+        score = similarity(fingerprint, entry)
+        if score >= MIN_MATCH_SCORE:
+            candidates.append((score, bank, entry))
+
+    for score, bank, entry in sorted(candidates, key=lambda c: c[0], reverse=True):
+        try:
+            with open(entry["parser_path"], "rb") as f:
+                code = f.read()
+        except OSError:
+            continue
+        if hashlib.sha256(code).hexdigest() != entry.get("sha256") and not _revalidate(bank, index_path):
+            continue
+        return {"bank": bank, "score": score, "parser_path": entry["parser_path"], "code": code.decode("utf-8")}
+    return None
@@ -0,0 +1,27 @@
+import pytest
+import os
+import sys
+
+# --- Add the project root to the Python path ---
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from src.langgraphagent.benchmark import _percentile
+
+@pytest.mark.parametrize("n, pct, expected", [
+    (10, 50, 5),
+    (10, 90, 9),
+    (10, 100, 10),
+    (100, 99, 99),
+    (100, 7, 7),
+    (2, 50, 1),
+    (1, 99, 1),
+    (5, 0, 1),
+])
+def test_percentile_is_nearest_rank(n, pct, expected):
+    values = list(range(n, 0, -1))
+    assert _percentile(values, pct) == expected
+
+def test_percentile_of_empty_list():
+    assert _percentile([], 50) == 0.0
@@ -0,0 +1,104 @@
+import pytest
+import os
+import shutil
+import time
+import sys
+
+# --- Add the project root to the Python path ---
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from langchain_core.callbacks import BaseCallbackHandler
+from langchain_core.messages import HumanMessage
+from src.langgraphagent.llms.llmscripted import SCRIPTED_FAILURE_CODE, ScriptedChatModel, ScriptedLLM
+from src.langgraphagent.nodes.planner_node import PlannerNode
+from src.langgraphagent.nodes.coder_node import CoderNode
+from src.langgraphagent.nodes.corrector_node import CorrectorNode
+
+SUCCESS_CODE = "import pandas as pd\n\ndef parse(pdf_path: str) -> pd.DataFrame:\n    return pd.DataFrame()"
+
+STATE = {
+    "target_bank": "scripted",
+    "plan": "",
+    "generated_code": "",
+    "error_message": "boom",
+    "retries_left": 3,
+}
+
+@pytest.fixture(autouse=True)
+def workspace(tmp_path, monkeypatch):
+    """The coder and corrector write their output to custom_parsers/, so run in a scratch directory."""
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+def _model(**kwargs):
+    scripts = {"planner": ["step one"], "coder": ["fail"], "corrector": ["fail", "pass"]}
+    return ScriptedChatModel(scripts=scripts, success_code=SUCCESS_CODE, **kwargs)
+
+def test_nodes_pick_their_own_scripts():
+    model = _model()
+    assert PlannerNode(model).process(STATE)["plan"] == "step one"
+    assert CoderNode(model).process(STATE)["generated_code"] == SCRIPTED_FAILURE_CODE.strip()
+    assert CorrectorNode(model).process(STATE)["generated_code"] == SCRIPTED_FAILURE_CODE.strip()
+
+def test_scripts_advance_in_order_and_repeat_last():
+    model = _model()
+    corrector = CorrectorNode(model)
+    outputs = [corrector.process(STATE)["generated_code"] for _ in range(3)]
+    assert outputs == [SCRIPTED_FAILURE_CODE.strip(), SUCCESS_CODE, SUCCESS_CODE]
+
+def test_each_model_keeps_its_own_position():
+    llm_config = ScriptedLLM(scripts={"corrector": ["fail", "pass"]}, success_code=SUCCESS_CODE)
+    first, second = llm_config.get_llm_model(), llm_config.get_llm_model()
+    CorrectorNode(first).process(STATE)
+    assert CorrectorNode(second).process(STATE)["generated_code"] == SCRIPTED_FAILURE_CODE.strip()
+
+def test_untagged_call_is_rejected():
+    with pytest.raises(ValueError, match="tags"):
+        _model().invoke([HumanMessage(content="hello")])
+
+class _TokenCollector(BaseCallbackHandler):
+    def __init__(self):
+        self.tokens = []
+
+    def on_llm_new_token(self, token, **kwargs):
+        self.tokens.append(token)
+
+def test_streaming_sends_tokens_to_callbacks():
+    collector = _TokenCollector()
+    response = _model(streaming=True).invoke(
+        [HumanMessage(content="hello")], config={"tags": ["corrector"], "callbacks": [collector]}
+    )
+    assert len(collector.tokens) > 1
+    assert "".join(collector.tokens) == response.content.rstrip()
+
+def test_without_streaming_no_tokens_are_sent():
+    collector = _TokenCollector()
+    _model().invoke([HumanMessage(content="hello")], config={"tags": ["planner"], "callbacks": [collector]})
+    assert collector.tokens == []
+
+def test_streaming_model_works_through_nodes():
+    model = _model(streaming=True)
+    assert CorrectorNode(model).process(STATE)["generated_code"] == SCRIPTED_FAILURE_CODE.strip()
+
+def test_default_success_code_passes_the_tester(workspace):
+    sys.path.insert(0, str(workspace))
+    try:
+        from src.langgraphagent.tools.test_tools import run_tests
+        bank_dir = workspace / "data" / "scripted"
+        bank_dir.mkdir(parents=True)
+        shutil.copy(os.path.join(project_root, "data/icici/icici sample.pdf"), bank_dir / "scripted sample.pdf")
+        shutil.copy(os.path.join(project_root, "data/icici/result.csv"), bank_dir / "result.csv")
+        model = ScriptedLLM().get_llm_model()
+        CoderNode(model).process(STATE)
+        CorrectorNode(model).process(STATE)
+        assert "successfully" in run_tests("scripted")
+    finally:
+        sys.path.remove(str(workspace))
+
+def test_token_latency_applies_without_streaming():
+    model = _model(token_latency=0.01)
+    start = time.perf_counter()
+    model.invoke([HumanMessage(content="hello")], config={"tags": ["planner"]})
+    assert time.perf_counter() - start >= 0.02
@@ -0,0 +1,158 @@
+import pytest
+import json
+import os
+import shutil
+import sys
+
+# --- Add the project root to the Python path ---
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from src.langgraphagent.tools.parser_index import (
+    MIN_MATCH_SCORE,
+    find_closest_parser,
+    fingerprint_pdf,
+    load_index,
+    register_parser,
+    similarity,
+)
+from src.langgraphagent.nodes.retriever_node import RetrieverNode
+from src.langgraphagent.nodes import tester_node
+
+ICICI_PDF = os.path.join(project_root, "data/icici/icici sample.pdf")
+
+def _add_bank(workspace, bank):
+    """Copies the ICICI sample data into the workspace under another bank's name."""
+    bank_dir = workspace / "data" / bank
+    bank_dir.mkdir(parents=True)
+    shutil.copy(ICICI_PDF, bank_dir / f"{bank} sample.pdf")
+    shutil.copy(os.path.join(project_root, "data/icici/result.csv"), bank_dir / "result.csv")
+
+@pytest.fixture
+def workspace(tmp_path, monkeypatch):
+    """A scratch project with the ICICI data and its proven parser, used as the working directory."""
+    (tmp_path / "custom_parsers").mkdir()
+    shutil.copy(os.path.join(project_root, "custom_parsers/icici_parser.py"), tmp_path / "custom_parsers")
+    _add_bank(tmp_path, "icici")
+    _add_bank(tmp_path, "newbank")
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+def test_fingerprint_finds_icici_header():
+    fingerprint = fingerprint_pdf(ICICI_PDF)
+    assert fingerprint is not None
+    assert {"date", "description", "debit", "credit", "balance"} <= set(fingerprint["header_tokens"])
+    assert len(fingerprint["column_edges"]) == 6
+
+def test_icici_matches_itself():
+    fingerprint = fingerprint_pdf(ICICI_PDF)
+    assert similarity(fingerprint, fingerprint) == 1.0
+
+def test_layout_without_shared_tokens_is_rejected():
+    icici = fingerprint_pdf(ICICI_PDF)
+    other = {
+        "header_tokens": ["bal", "deposit", "narration", "withdrawal"],
+        "column_edges": icici["column_edges"],
+    }
+    assert similarity(icici, other) == 0.0
+
+def test_weak_token_overlap_is_below_threshold():
+    icici = fingerprint_pdf(ICICI_PDF)
+    other = {"header_tokens": ["date", "narration", "withdrawal", "deposit", "bal"], "column_edges": icici["column_edges"]}
+    assert similarity(icici, other) < MIN_MATCH_SCORE
+
+def test_missing_index_is_built_from_passing_parsers(workspace):
+    index = load_index()
+    assert list(index) == ["icici"]
+    assert os.path.exists(workspace / "custom_parsers/parser_index.json")
+
+def test_dissimilar_layout_is_not_returned(workspace):
+    other = {"header_tokens": ["bal", "date", "deposit", "narration", "withdrawal"],
+             "column_edges": [0.02, 0.2, 0.4, 0.6, 0.8, 0.98],
+             "parser_path": "custom_parsers/icici_parser.py"}
+    index = load_index()
+    index["icici"].update(other)
+    (workspace / "custom_parsers/parser_index.json").write_text(json.dumps(index))
+    assert find_closest_parser("newbank") is None
+
+def test_empty_index_finds_nothing(workspace):
+    (workspace / "custom_parsers/parser_index.json").write_text("{}")
+    assert find_closest_parser("newbank") is None
+
+def test_closest_parser_comes_from_another_bank(workspace):
+    match = find_closest_parser("newbank")
+    assert match["bank"] == "icici"
+    assert match["score"] == 1.0
+    assert "def parse" in match["code"]
+
+def test_target_bank_is_excluded(workspace):
+    assert find_closest_parser("icici") is None
+
+def _with_workspace_on_path(workspace, func, *args):
+    """run_tests imports custom_parsers from the working directory, so put it on the path."""
+    sys.path.insert(0, str(workspace))
+    try:
+        return func(*args)
+    finally:
+        sys.path.remove(str(workspace))
+
+def test_broken_overwritten_parser_is_dropped(workspace):
+    load_index()
+    (workspace / "custom_parsers/icici_parser.py").write_text("def parse(pdf_path):\n    raise ValueError\n")
+    assert _with_workspace_on_path(workspace, find_closest_parser, "newbank") is None
+    assert "icici" not in load_index()
+
+def test_changed_parser_that_still_passes_is_offered_again(workspace):
+    old_hash = load_index()["icici"]["sha256"]
+    parser_file = workspace / "custom_parsers/icici_parser.py"
+    parser_file.write_text(parser_file.read_text() + "\n# hand fix\n")
+    match = _with_workspace_on_path(workspace, find_closest_parser, "newbank")
+    assert match["bank"] == "icici"
+    assert match["code"].endswith("# hand fix\n")
+    assert load_index()["icici"]["sha256"] != old_hash
+
+def test_entry_without_hash_is_revalidated(workspace):
+    index = load_index()
+    del index["icici"]["sha256"]
+    (workspace / "custom_parsers/parser_index.json").write_text(json.dumps(index))
+    match = _with_workspace_on_path(workspace, find_closest_parser, "newbank")
+    assert match["bank"] == "icici"
+    assert "sha256" in load_index()["icici"]
+
+def test_building_from_retriever_skips_target_parser(workspace):
+    (workspace / "custom_parsers/newbank_parser.py").write_text("raise SystemExit('should not be imported')\n")
+    match = _with_workspace_on_path(workspace, find_closest_parser, "newbank")
+    assert match["bank"] == "icici"
+    assert "newbank" not in load_index()
+
+def test_unreadable_best_match_falls_back_to_next(workspace):
+    index = load_index()
+    index["aaa"] = dict(index["icici"], parser_path="custom_parsers/missing_parser.py")
+    index["icici"]["header_tokens"] = index["icici"]["header_tokens"][:-1]
+    (workspace / "custom_parsers/parser_index.json").write_text(json.dumps(index))
+    match = find_closest_parser("newbank")
+    assert match["bank"] == "icici"
+    assert match["score"] < 1.0
+
+def test_retriever_node_returns_reference(workspace):
+    result = RetrieverNode().process({"target_bank": "newbank"})
+    assert result["reference_bank"] == "icici"
+    assert result["reference_code"] == (workspace / "custom_parsers/icici_parser.py").read_text()
+
+def test_tester_pass_registers_parser(workspace):
+    shutil.copy(workspace / "custom_parsers/icici_parser.py", workspace / "custom_parsers/newbank_parser.py")
+    result = _with_workspace_on_path(workspace, tester_node.TesterNode().process, {"target_bank": "newbank"})
+    assert result["error_message"] is None
+    assert "newbank" in load_index()
+
+def test_register_parser_skips_missing_sample(workspace):
+    register_parser("nosuchbank")
+    assert "nosuchbank" not in load_index()
+
+def test_save_index_leaves_no_temp_files(workspace):
+    load_index()
+    register_parser("newbank")
+    files = os.listdir(workspace / "custom_parsers")
+    assert not [f for f in files if f.endswith(".tmp")]
+    assert (workspace / "custom_parsers/parser_index.json").read_text().endswith("}\n")